@@ -16,6 +16,8 @@ class AcqOptimizer(Base):
     Class for optimizing acquisition functions.
     """
 
+    _hidden_print_keys = ("x_batch",)
+
     def set_params(self, params):
         """Set self.params, the parameters for the AcqOptimizer."""
         super().set_params(params)
@@ -90,8 +92,3 @@ class AcqOptimizer(Base):
                     break
 
         return x_batch
-
-    def set_print_params(self):
-        """Set self.print_params."""
-        self.print_params = copy.deepcopy(self.params)
-        delattr(self.print_params, "x_batch")
@@ -4,6 +4,8 @@ Algorithms for BAX.
 
 from argparse import Namespace
 import copy
+import random
+import time
 import numpy as np
 from abc import ABC, abstractmethod
 
@@ -13,6 +15,23 @@ from ..util.domain_util import unif_random_sample_domain
 from ..util.graph import jaccard_similarity
 
 
+class ExePath:
+    """
+    Container for an execution path, with slot-based x and y attributes: access
+    is a direct C-array index rather than a __dict__ lookup, which matters in
+    the per-step get_next_x path.
+    """
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x=None, y=None):
+        self.x = [] if x is None else x
+        self.y = [] if y is None else y
+
+    def __repr__(self):
+        return f"ExePath(x={self.x}, y={self.y})"
+
+
 class Algorithm(ABC, Base):
     """Base class for a BAX Algorithm"""
 
@@ -24,7 +43,7 @@ class Algorithm(ABC, Base):
 
     def initialize(self):
         """Initialize algorithm, reset execution path."""
-        self.exe_path = Namespace(x=[], y=[])
+        self.exe_path = ExePath()
 
     def get_next_x(self):
         """
@@ -94,6 +113,8 @@ class FixedPathAlgorithm(Algorithm):
     Algorithm with a fixed execution path input sequence, specified by x_path parameter.
     """
 
+    _hidden_print_keys = ("x_path",)
+
     def set_params(self, params):
         """Set self.params, the parameters for the algorithm."""
         super().set_params(params)
@@ -101,6 +122,14 @@ class FixedPathAlgorithm(Algorithm):
 
         self.params.name = getattr(params, "name", "FixedPathAlgorithm")
         self.params.x_path = getattr(params, "x_path", [])
+        self._n_xpath = len(self.params.x_path)
+
+    def initialize(self):
+        """Initialize algorithm, reset execution path."""
+        super().initialize()
+
+        # Refresh cached x_path length, in case x_path was re-drawn since set_params
+        self._n_xpath = len(self.params.x_path)
 
     def get_next_x(self):
         """
@@ -108,8 +137,7 @@ class FixedPathAlgorithm(Algorithm):
         the algorithm is complete, return None.
         """
         len_path = len(self.exe_path.x)
-        x_path = self.params.x_path
-        next_x = x_path[len_path] if len_path < len(x_path) else None
+        next_x = self.params.x_path[len_path] if len_path < self._n_xpath else None
         return next_x
 
     def get_output(self):
@@ -117,11 +145,6 @@ class FixedPathAlgorithm(Algorithm):
         # Default behavior: return execution path
         return self.exe_path
 
-    def set_print_params(self):
-        """Set self.print_params."""
-        super().set_print_params()
-        delattr(self.print_params, "x_path")
-
 
 class LinearScan(FixedPathAlgorithm):
     """
@@ -135,6 +158,31 @@ class LinearScan(FixedPathAlgorithm):
         params = dict_to_namespace(params)
 
         self.params.name = getattr(params, "name", "LinearScan")
+        self.params.batch = getattr(params, "batch", False)
+
+    def run_algorithm_on_f(self, f):
+        """
+        Run the algorithm by querying function f. If the batch param is True, f is
+        assumed to be vectorized and is queried once on the full x_path grid rather
+        than one point at a time. Otherwise, iterate the fully-known x_path
+        directly, skipping the per-step get_next_x dispatch of the generic driver
+        (get_next_x is kept for external steppers such as AlgorithmSet).
+        """
+        self.initialize()
+
+        if self.params.batch:
+            xs = np.asarray(self.params.x_path)
+            ys = f(xs)
+            self.exe_path.x = list(xs)
+            self.exe_path.y = list(ys)
+        else:
+            exe_path_x = self.exe_path.x
+            exe_path_y = self.exe_path.y
+            for x in self.params.x_path:
+                exe_path_x.append(x)
+                exe_path_y.append(f(x))
+
+        return self.exe_path, self.get_output()
 
     def get_output(self):
         """Return algorithm output given the execution path."""
@@ -148,6 +196,8 @@ class LinearScanRandGap(LinearScan):
     grid.
     """
 
+    _hidden_print_keys = ("x_path", "x_path_orig")
+
     def set_params(self, params):
         """Set self.params, the parameters for the algorithm."""
         super().set_params(params)
@@ -156,29 +206,29 @@ class LinearScanRandGap(LinearScan):
         self.params.name = getattr(params, "name", "LinearScanRandGap")
         self.params.x_path_orig = copy.deepcopy(self.params.x_path)
 
+        # Cache x_path min/max/length as plain scalars for path resampling, so
+        # x_path_orig is never touched at runtime
+        x_path_arr = np.asarray(self.params.x_path, dtype=np.float64)
+        self._min_x_path = float(np.min(x_path_arr))
+        self._max_x_path = float(np.max(x_path_arr))
+        self._n_grid = len(x_path_arr)
+
+        # Precompute grid-size bounds for the random re-draw in run_algorithm_on_f
+        rand_factor = 0.2
+        self._min_gap = int(np.ceil((1 - rand_factor) * self._n_grid))
+        self._max_gap = int(np.ceil((1 + rand_factor) * self._n_grid))
+
     def run_algorithm_on_f(self, f):
         """
         Run the algorithm by sequentially querying function f. Return the execution path
         and output.
         """
-        x_path = copy.deepcopy(self.params.x_path_orig)
-        n_grid = len(x_path)
-        rand_factor = 0.2
-        min_gap = np.ceil((1 - rand_factor) * n_grid)
-        max_gap = np.ceil((1 + rand_factor) * n_grid)
-        new_n_grid = np.random.randint(min_gap, max_gap)
-        min_x_path = np.min(x_path)
-        max_x_path = np.max(x_path)
-        new_x_path = [[x] for x in np.linspace(min_x_path, max_x_path, new_n_grid)]
-        self.params.x_path = new_x_path
+        new_n_grid = np.random.randint(self._min_gap, self._max_gap)
+        new_x_path = np.linspace(self._min_x_path, self._max_x_path, new_n_grid)
+        self.params.x_path = new_x_path.reshape(-1, 1)
 
         return super().run_algorithm_on_f(f)
 
-    def set_print_params(self):
-        """Set self.print_params."""
-        super().set_print_params()
-        delattr(self.print_params, "x_path_orig")
-
 
 class AverageOutputs(FixedPathAlgorithm):
     """
@@ -191,10 +241,42 @@ class AverageOutputs(FixedPathAlgorithm):
         params = dict_to_namespace(params)
 
         self.params.name = getattr(params, "name", "AverageOutputs")
+        self.params.keep_y = getattr(params, "keep_y", True)
+
+    def initialize(self):
+        """Initialize algorithm, reset execution path and running sum."""
+        super().initialize()
+        self._sum_y = 0.0
+        self._count_y = 0
+
+    def run_algorithm_on_f(self, f):
+        """
+        Run the algorithm by sequentially querying function f, accumulating a
+        running sum of outputs so the mean needs no list-to-array conversion. If
+        the keep_y param is False, y values are not stored on the execution path.
+        """
+        self.initialize()
+
+        x = self.get_next_x()
+        while x is not None:
+            y = f(x)
+            self.exe_path.x.append(x)
+            if self.params.keep_y:
+                self.exe_path.y.append(y)
+            self._sum_y += y
+            self._count_y += 1
+            x = self.get_next_x()
+
+        return self.exe_path, self.get_output()
 
     def get_output(self):
         """Return output based on self.exe_path."""
-        return np.mean(self.exe_path.y)
+        if self._count_y:
+            return self._sum_y / self._count_y
+
+        # Stepped externally (e.g. via AlgorithmSet): average the stored y values
+        y = self.exe_path.y
+        return np.fromiter(y, dtype=np.float64, count=len(y)).mean()
 
 
 class SortOutputs(FixedPathAlgorithm):
@@ -211,7 +293,8 @@ class SortOutputs(FixedPathAlgorithm):
 
     def get_output(self):
         """Return output based on self.exe_path."""
-        return np.argsort(self.exe_path.y)
+        y = self.exe_path.y
+        return np.argsort(np.fromiter(y, dtype=np.float64, count=len(y)))
 
 
 class OptRightScan(Algorithm):
@@ -232,6 +315,15 @@ class OptRightScan(Algorithm):
         self.params.max_iter = getattr(params, "max_iter", 100)
         self.params.crop_str = getattr(params, "crop_str", "min")
 
+    def initialize(self):
+        """Initialize algorithm, reset execution path and running minimum."""
+        super().initialize()
+
+        # Running minimum over exe_path.y[:-1], folded in incrementally in
+        # get_next_x, so the convergence check is a single comparison per step
+        self._running_min = float("inf")
+        self._n_min_seen = 0
+
     def get_next_x(self):
         """
         Given the current execution path, return the next x in the execution path. If
@@ -244,7 +336,13 @@ class OptRightScan(Algorithm):
             next_x = [self.exe_path.x[-1][0] + self.params.x_grid_gap]
 
         if len_path >= 2:
-            conv_max_val = np.min(self.exe_path.y[:-1]) + self.params.conv_thresh
+            # Fold all y values but the most recent into the running minimum
+            while self._n_min_seen < len_path - 1:
+                y_val = self.exe_path.y[self._n_min_seen]
+                if y_val < self._running_min:
+                    self._running_min = y_val
+                self._n_min_seen += 1
+            conv_max_val = self._running_min + self.params.conv_thresh
             if self.exe_path.y[-1] > conv_max_val:
                 next_x = None
 
@@ -518,18 +616,24 @@ class Noop(Algorithm):
 
     def run_algorithm_on_f(self, f):
         """
-        Run the dummy noop algorithm. Note that we must reseed each time or else child
-        process will have the same state as parent, resulting in the same randomness.
+        Run the dummy noop algorithm. Randomness comes from a per-process Generator
+        rather than reseeding the global numpy RNG on every call: the Generator is
+        constructed lazily at first use, so worker processes that never inherited
+        one get their own independent stream. Callers using multiprocessing.Pool
+        should construct the rng in a pool initializer.
         """
-        np.random.seed()
+        if getattr(self, "_rng", None) is None:
+            self._rng = np.random.default_rng()
         self.initialize()
 
         output = 0
         wait_time = random.randint(1, 5)
-        rand = np.random.rand(1)
-        print(f"Got {rand}. Going to wait for {wait_time} seconds")
+        rand = self._rng.random()
+        if self.params.verbose:
+            print(f"Got {rand}. Going to wait for {wait_time} seconds")
         time.sleep(wait_time)
-        print(f"Finished waiting for {wait_time} seconds")
+        if self.params.verbose:
+            print(f"Finished waiting for {wait_time} seconds")
 
         return self.exe_path, output
 
@@ -5,12 +5,162 @@ Dijkstra's algorithm for BAX.
 from argparse import Namespace
 import copy
 import heapq
+import itertools
+from typing import List
+
 import numpy as np
 
-from .algorithms import Algorithm
+from .algorithms import Algorithm, ExePath
 from ..util.misc_util import dict_to_namespace
 from ..util.graph import Vertex, backtrack_indices, edges_of_path, jaccard_similarity
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+class RadixHeap:
+    """
+    Monotone priority queue for integer keys (Ahuja-Mehlhorn-Orlin-Tarjan radix
+    heap), giving O(m + n log C) Dijkstra versus O((m + n) log n) with a binary
+    heap. Push is an O(1) bucket append; pop redistributes the lowest nonempty
+    bucket around its minimum key. Keys must never decrease below the last
+    extracted key, which Dijkstra guarantees. There is no decrease-key; callers
+    rely on lazy deletion (skipping already-explored vertices on pop).
+    """
+
+    def __init__(self, num_bits=64):
+        self.buckets = [[] for _ in range(num_bits + 1)]
+        self.last = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _bucket_index(self, key):
+        # 0 when key == last; otherwise position of highest differing bit + 1
+        return (key ^ self.last).bit_length()
+
+    def push(self, key, item):
+        key = int(key)
+        self.buckets[self._bucket_index(key)].append((key, item))
+        self.size += 1
+
+    def pop(self):
+        if not self.buckets[0]:
+            # Redistribute the lowest nonempty bucket around its minimum key
+            i = next(i for i, bucket in enumerate(self.buckets) if bucket)
+            bucket = self.buckets[i]
+            self.buckets[i] = []
+            self.last = min(key for key, _ in bucket)
+            for key, item in bucket:
+                self.buckets[self._bucket_index(key)].append((key, item))
+        self.size -= 1
+        return self.buckets[0].pop()
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _heap_push(heap_keys, heap_idxs, size, key, idx):
+        """
+        Push (key, idx) onto the parallel-array binary heap, doubling capacity on
+        overflow. Returns (heap_keys, heap_idxs, size), since the arrays may have
+        been reallocated.
+        """
+        if size >= heap_keys.shape[0]:
+            new_keys = np.empty(2 * heap_keys.shape[0], dtype=np.float64)
+            new_idxs = np.empty(2 * heap_idxs.shape[0], dtype=np.int32)
+            new_keys[:size] = heap_keys
+            new_idxs[:size] = heap_idxs
+            heap_keys = new_keys
+            heap_idxs = new_idxs
+
+        pos = size
+        heap_keys[pos] = key
+        heap_idxs[pos] = idx
+        size += 1
+        while pos > 0:
+            parent = (pos - 1) // 2
+            if heap_keys[pos] < heap_keys[parent]:
+                heap_keys[pos], heap_keys[parent] = heap_keys[parent], heap_keys[pos]
+                heap_idxs[pos], heap_idxs[parent] = heap_idxs[parent], heap_idxs[pos]
+                pos = parent
+            else:
+                break
+
+        return heap_keys, heap_idxs, size
+
+    @njit(cache=True)
+    def _heap_pop(heap_keys, heap_idxs, size):
+        """Pop the minimum (key, idx) off the array heap. Returns (key, idx, size)."""
+        key = heap_keys[0]
+        idx = heap_idxs[0]
+        size -= 1
+        heap_keys[0] = heap_keys[size]
+        heap_idxs[0] = heap_idxs[size]
+        pos = 0
+        while True:
+            child = 2 * pos + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap_keys[child + 1] < heap_keys[child]:
+                child += 1
+            if heap_keys[child] < heap_keys[pos]:
+                heap_keys[pos], heap_keys[child] = heap_keys[child], heap_keys[pos]
+                heap_idxs[pos], heap_idxs[child] = heap_idxs[child], heap_idxs[pos]
+                pos = child
+            else:
+                break
+
+        return key, idx, size
+
+    @njit(cache=True)
+    def _dijkstra_csr(indptr, indices, weights, start, goal):
+        """
+        Array-heap Dijkstra over a CSR graph (indptr, indices, weights). Returns
+        (best_cost, prev) where prev uses -1 as the no-predecessor sentinel;
+        best_cost is inf if no path exists.
+        """
+        n = indptr.shape[0] - 1
+        m = indices.shape[0]
+        explored = np.zeros(n, dtype=np.bool_)
+        min_cost = np.full(n, np.inf, dtype=np.float64)
+        prev = np.full(n, -1, dtype=np.int32)
+
+        # Binary heap as parallel typed arrays; capacity m covers one push per edge
+        heap_keys = np.empty(max(m, 1), dtype=np.float64)
+        heap_idxs = np.empty(max(m, 1), dtype=np.int32)
+        size = 0
+        heap_keys, heap_idxs, size = _heap_push(heap_keys, heap_idxs, size, 0.0, start)
+
+        while size > 0:
+            best_cost, current, size = _heap_pop(heap_keys, heap_idxs, size)
+
+            if explored[current]:
+                continue
+            explored[current] = True
+            if current == goal:
+                return best_cost, prev
+
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                new_cost = best_cost + weights[e]
+                if (not explored[neighbor]) and new_cost < min_cost[neighbor]:
+                    min_cost[neighbor] = new_cost
+                    prev[neighbor] = current
+                    heap_keys, heap_idxs, size = _heap_push(
+                        heap_keys, heap_idxs, size, new_cost, neighbor
+                    )
+
+        return np.inf, prev
+
+else:
+    _heap_push = None
+    _heap_pop = None
+    _dijkstra_csr = None
+
 
 class Dijkstra(Algorithm):
     """
@@ -65,17 +215,26 @@ class Dijkstra(Algorithm):
 
         self.params.name = getattr(params, "name", "Dijkstras")
         self.params.cost_func = getattr(params, "cost_func", lambda u, v: 0)
+        self.params.cost_func_batched = getattr(params, "cost_func_batched", None)
         self.params.true_cost = getattr(params, "true_cost", lambda u, v: 0)
+        self.params.true_cost_batched = getattr(params, "true_cost_batched", None)
+        self.params.queue_type = getattr(params, "queue_type", "heapq")
+        assert self.params.queue_type in ["heapq", "radix"]
 
     def initialize(self):
         """Initialize algorithm, reset execution path."""
         super().initialize()
 
-        # Set up Dijkstra's
-        self.explored = [False for _ in range(len(self.vertices))]
-        self.min_cost = [float("inf") for _ in range(len(self.vertices))]
-        self.prev = [None for _ in range(len(self.vertices))]
-        self.to_explore = [(0, self.start)]  # initialize priority queue
+        # Set up Dijkstra's, using typed arrays (prev uses -1 as "no predecessor")
+        n = len(self.vertices)
+        self.explored = np.zeros(n, dtype=np.bool_)
+        self.min_cost = np.full(n, np.inf, dtype=np.float64)
+        self.prev = np.full(n, -1, dtype=np.int32)
+        # Priority queue of (cost, tie-breaker, vertex index); the counter keeps heap
+        # comparisons on ints (never falling through to Vertex) and gives FIFO order
+        # on cost ties
+        self.heap_counter = itertools.count()
+        self.to_explore = [(0, next(self.heap_counter), self.start.index)]
         self.num_expansions = 0
         self.num_queries = 0
         self.best_cost = float("inf")
@@ -101,12 +260,13 @@ class Dijkstra(Algorithm):
 
             # If algorithm is already complete, return None
             if len(self.to_explore) == 0:
-                if not self.best_path:
+                if not self.best_path and self.params.verbose:
                     print("No path exists to goal")
                 return None
 
             # If self.current does not exist, set self.current and other variables
-            self.best_cost, self.current = heapq.heappop(self.to_explore)
+            self.best_cost, _, current_idx = heapq.heappop(self.to_explore)
+            self.current = self.vertices[current_idx]
             if self.explored[self.current.index]:
                 # the same node could appear in the pqueue multiple times with different costs
                 self.current = None
@@ -152,7 +312,10 @@ class Dijkstra(Algorithm):
             self.best_cost + step_cost < self.min_cost[neighbor.index]
         ):
             # Push by cost
-            heapq.heappush(self.to_explore, (self.best_cost + step_cost, neighbor))
+            heapq.heappush(
+                self.to_explore,
+                (self.best_cost + step_cost, next(self.heap_counter), neighbor.index),
+            )
             self.min_cost[neighbor.index] = self.best_cost + step_cost
             self.prev[neighbor.index] = self.current.index
 
@@ -166,76 +329,167 @@ class Dijkstra(Algorithm):
 
     def finish_algorithm(self):
         """To do if algorithm completes."""
-        print(
-            f"Found goal after {self.num_expansions} expansions and "
-            f"{self.num_queries} queries with estimated cost {self.best_cost}"
-        )
+        if self.params.verbose:
+            print(
+                f"Found goal after {self.num_expansions} expansions and "
+                f"{self.num_queries} queries with estimated cost {self.best_cost}"
+            )
         self.best_path = [
             self.vertices[i] for i in backtrack_indices(self.current.index, self.prev)
         ]
 
-        def print_true_cost_of_path(path):
-            cost = 0
-            for i in range(len(path) - 1):
-                cost += self.params.true_cost(path[i], path[i + 1])[0]
-            print(f"True cost: {cost}")
+        if self.params.verbose:
+            print(f"True cost: {self.true_cost_of_path(self.best_path)}")
+
+    def true_cost_of_path(self, path):
+        """Return the true cost of a path, batching over the edge list if possible."""
+        if self.params.true_cost_batched is not None and len(path) > 1:
+            return self.params.true_cost_batched(path[:-1], path[1:]).sum()
+
+        cost = 0
+        for i in range(len(path) - 1):
+            cost += self.params.true_cost(path[i], path[i + 1])[0]
+        return cost
+
+    def _build_csr(self):
+        """Return cached (indptr, indices) CSR arrays for the vertex graph."""
+        if getattr(self, "_csr", None) is None:
+            n = len(self.vertices)
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            for vertex in self.vertices:
+                indptr[vertex.index + 1] = len(vertex.neighbors)
+            indptr = np.cumsum(indptr)
+            indices = np.empty(indptr[-1], dtype=np.int32)
+            for vertex in self.vertices:
+                k = indptr[vertex.index]
+                for neighbor in vertex.neighbors:
+                    indices[k] = neighbor.index
+                    k += 1
+            self._csr = (indptr, indices)
+
+        return self._csr
+
+    def run_algorithm_on_f_csr(self, f):
+        """
+        Static-weights fast path: query all edge costs in one pass over the graph,
+        then run a numba-jitted array-heap Dijkstra over a CSR representation of
+        the graph. Requires numba, and is only valid when cost_func gives the same
+        cost each time an edge is queried (static weights), since every edge is
+        queried up front rather than on expansion.
+        """
+        assert njit is not None, "numba is required for the CSR Dijkstra path"
+        indptr, indices = self._build_csr()
+
+        exe_path = ExePath()
+        weights = np.empty(len(indices), dtype=np.float64)
+        for vertex in self.vertices:
+            k = indptr[vertex.index]
+            for neighbor in vertex.neighbors:
+                cost, xs, ys = self.params.cost_func(vertex, neighbor, f)
+                assert cost >= 0
+                exe_path.x.extend(xs)
+                exe_path.y.extend(ys)
+                weights[k] = cost
+                k += 1
+
+        best_cost, prev = _dijkstra_csr(
+            indptr, indices, weights, self.start.index, self.goal.index
+        )
+        if np.isinf(best_cost):
+            if self.params.verbose:
+                print("No path exists to goal")
+            return exe_path, (float("inf"), [])
 
-        print_true_cost_of_path(self.best_path)
+        best_path = [
+            self.vertices[i] for i in backtrack_indices(self.goal.index, prev)
+        ]
+        return exe_path, (best_cost, best_path)
 
     def run_algorithm_on_f_standalone(self, f):
 
-        # prevent parallel processes from sharing random state
-        # np.random.seed()
-
         def dijkstras(start: Vertex, goal: Vertex):
             """Dijkstra's algorithm."""
-            explored = [False for _ in range(len(self.vertices))]
-            min_cost = [float("inf") for _ in range(len(self.vertices))]
-            prev = [None for _ in range(len(self.vertices))]
-            to_explore = [(0, start)]  # initialize priority queue
+            n = len(self.vertices)
+            explored = np.zeros(n, dtype=np.bool_)
+            min_cost = np.full(n, np.inf, dtype=np.float64)
+            prev = np.full(n, -1, dtype=np.int32)
+            # Initialize priority queue; radix queue requires integer edge costs
+            use_radix = self.params.queue_type == "radix"
+            if use_radix:
+                to_explore = RadixHeap()
+                to_explore.push(0, start.index)
+            else:
+                heap_counter = itertools.count()
+                to_explore = [(0, next(heap_counter), start.index)]
             num_expansions = 0
             num_queries = 0
 
             while len(to_explore) > 0:
-                best_cost, current = heapq.heappop(to_explore)
+                if use_radix:
+                    best_cost, current_idx = to_explore.pop()
+                else:
+                    best_cost, _, current_idx = heapq.heappop(to_explore)
+                current = self.vertices[current_idx]
                 if explored[current.index]:
                     # the same node could appear in the pqueue multiple times with different costs
                     continue
                 explored[current.index] = True
                 num_expansions += 1
                 if current.index == goal.index:
-                    print(
-                        f"Found goal after {num_expansions} expansions and {num_queries} queries with estimated cost {best_cost}"
-                    )
+                    if self.params.verbose:
+                        print(
+                            f"Found goal after {num_expansions} expansions and {num_queries} queries with estimated cost {best_cost}"
+                        )
                     best_path = [
                         self.vertices[i] for i in backtrack_indices(current.index, prev)
                     ]
 
-                    def true_cost_of_path(path):
-                        cost = 0
-                        for i in range(len(path) - 1):
-                            cost += self.params.true_cost(path[i], path[i + 1])[0]
-                        print("true cost", cost)
-
-                    true_cost_of_path(best_path)
+                    if self.params.verbose:
+                        print("true cost", self.true_cost_of_path(best_path))
                     return best_cost, best_path
 
-                for neighbor in current.neighbors:
-                    num_queries += 1
-                    step_cost = distance(current, neighbor)
+                if self.params.cost_func_batched is not None:
+                    # Query all unexplored neighbors in one call (one GP evaluation
+                    # of K edges instead of K GP evaluations)
+                    pending = [
+                        nbr for nbr in current.neighbors if not explored[nbr.index]
+                    ]
+                    num_queries += len(pending)
+                    step_costs = distance_batched(current, pending)
+                    relaxations = zip(pending, step_costs)
+                else:
+                    num_queries += len(current.neighbors)
+                    relaxations = (
+                        (nbr, distance(current, nbr)) for nbr in current.neighbors
+                    )
+
+                for neighbor, step_cost in relaxations:
                     if (not explored[neighbor.index]) and (
                         best_cost + step_cost < min_cost[neighbor.index]
                     ):
-                        heapq.heappush(
-                            to_explore, (best_cost + step_cost, neighbor)
-                        )  # push by cost
+                        # Push by cost
+                        if use_radix:
+                            assert isinstance(
+                                step_cost, (int, np.integer)
+                            ), "radix queue requires integer edge costs"
+                            to_explore.push(best_cost + step_cost, neighbor.index)
+                        else:
+                            heapq.heappush(
+                                to_explore,
+                                (
+                                    best_cost + step_cost,
+                                    next(heap_counter),
+                                    neighbor.index,
+                                ),
+                            )
                         min_cost[neighbor.index] = best_cost + step_cost
                         prev[neighbor.index] = current.index
 
-            print("No path exists to goal")
+            if self.params.verbose:
+                print("No path exists to goal")
             return float("inf"), []
 
-        exe_path = Namespace(x=[], y=[])
+        exe_path = ExePath()
 
         def distance(u: Vertex, v: Vertex):
             cost, xs, ys = self.params.cost_func(u, v, f)
@@ -245,6 +499,16 @@ class Dijkstra(Algorithm):
             assert cost >= 0
             return cost
 
+        def distance_batched(u: Vertex, vs: List[Vertex]):
+            if not vs:
+                return []
+            costs, xs, ys = self.params.cost_func_batched(u, vs, f)
+
+            exe_path.x.extend(xs)
+            exe_path.y.extend(ys)
+            assert all(cost >= 0 for cost in costs)
+            return costs
+
         min_cost = dijkstras(self.start, self.goal)
 
         return exe_path, min_cost
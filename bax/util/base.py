@@ -3,7 +3,6 @@ Base classes.
 """
 
 from argparse import Namespace
-import copy
 
 from .misc_util import dict_to_namespace
 
@@ -11,6 +10,9 @@ from .misc_util import dict_to_namespace
 class Base:
     """Simple base class."""
 
+    # Params keys omitted from print_params; subclasses override with their own tuple
+    _hidden_print_keys = ()
+
     def __init__(self, params=None, verbose=True):
         """
         Parameters
@@ -40,9 +42,12 @@ class Base:
         print('*[INFO] Initialized ' + str(self))
 
     def set_print_params(self):
-        """Set self.print_params."""
+        """Set self.print_params, a shallow copy of params minus hidden keys."""
         if not hasattr(self, 'print_params'):
-            self.print_params = copy.deepcopy(self.params)
+            hidden_keys = self._hidden_print_keys
+            self.print_params = Namespace(
+                **{k: v for k, v in vars(self.params).items() if k not in hidden_keys}
+            )
 
     def __str__(self):
         self.set_print_params()
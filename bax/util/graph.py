@@ -1,6 +1,11 @@
 import numpy as np
 from typing import List
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 class Vertex:
     def __init__(self, index: int, position: np.array, neighbors=None):
@@ -56,12 +61,40 @@ def backtrack(goal: Vertex):
     return path[::-1]
 
 
-def backtrack_indices(goal: int, prev: List[int]):
+if njit is not None:
+
+    @njit(cache=True)
+    def _backtrack_walk(goal, prev):
+        """Walk an int predecessor array from goal to root, returning indices."""
+        depth = 1
+        v = goal
+        while prev[v] >= 0:
+            v = prev[v]
+            depth += 1
+        idx_arr = np.empty(depth, dtype=np.int32)
+        v = goal
+        for i in range(depth):
+            idx_arr[depth - 1 - i] = v
+            v = prev[v]
+        return idx_arr
+
+else:
+    _backtrack_walk = None
+
+
+def backtrack_indices(goal: int, prev):
+    """Walk a predecessor list/array (None or -1 marks "no predecessor")."""
+    if _backtrack_walk is not None and isinstance(prev, np.ndarray):
+        return _backtrack_walk(goal, prev)
+
     v = goal
     path = [v]
-    while prev[v] is not None:
-        path.append(prev[v])
-        v = prev[v]
+    while True:
+        p = prev[v]
+        if p is None or p < 0:
+            break
+        path.append(p)
+        v = p
     return path[::-1]
 
 